@@ -156,7 +156,7 @@ typedef struct {
 typedef struct {
 	int fd;
 	char* buf;
-        size_t len;
+	size_t len;
 	ssize_t ret;
 } __attribute__((packed)) uhyve_read_t;
 